@@ -115,6 +115,71 @@ class WosQuery:
                                    savebyeach=savebyeach, savepath=savepathprefix + "-" + str(count + 1) + ".json")
                   for count in range(self.num_items) if count + 1 not in masklist])
 
+    async def iter_papers(self, citedcheck=False, savebyeach=False, savepathprefix=None, limit=20,
+                          masklist=None, buffersize=None):
+        '''
+        asynchronous generator yielding metadata of papers satisfying the query as soon as each one is
+        downloaded, usage: ``async for paper in wq.iter_papers(): ...``. The papers come in the order of
+        completion instead of the order in the query. If the consumer is slower than the crawler, new
+        downloads are paused once ``buffersize`` papers are waiting to be consumed.
+
+        :param citedcheck: bool, if set to true, then all citation papers of given paper are also collected
+                    before the paper is yielded
+        :param limit: int, the size of tcp connection pool and the number of papers downloaded concurrently
+        :param savebyeach: bool, if set to true, metadata of each paper is saved immediately in files
+        :param savepathprefix: string, the path prefix for data files of each paper
+        :param masklist: list of int, if provided, for all numbers on the list, the corresponding task is canceled
+        :param buffersize: int, the max number of downloaded papers waiting for the consumer,
+                    default is the same as limit
+        '''
+        if not self.urlprefix:
+            raise wosException('run query first')
+        if masklist is None:
+            masklist = []
+        if buffersize is None:
+            buffersize = limit
+        counts = asyncio.Queue()
+        for count in range(self.num_items):
+            if count + 1 not in masklist:
+                counts.put_nowait(count + 1)
+        results = asyncio.Queue(maxsize=buffersize)
+        finished = object()
+
+        async def worker(session):
+            try:
+                while not counts.empty():
+                    count = counts.get_nowait()
+                    savepath = None
+                    if savebyeach:
+                        savepath = savepathprefix + "-" + str(count) + ".json"
+                    parse_dict = await self.parse_paper(session, self.urlprefix, count, citedcheck=citedcheck,
+                                                        savebyeach=savebyeach, savepath=savepath)
+                    await results.put(parse_dict)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await results.put(e)
+            else:
+                await results.put(finished)
+
+        conn = aiohttp.TCPConnector(limit_per_host=limit)
+        async with aiohttp.ClientSession(headers=self.headers, connector=conn) as session:
+            workers = [asyncio.ensure_future(worker(session)) for _ in range(min(limit, counts.qsize()))]
+            running = len(workers)
+            try:
+                while running:
+                    item = await results.get()
+                    if item is finished:
+                        running -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                for w in workers:
+                    w.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
     async def parse_paper(self, session, prefix, count, citedcheck=False,
                           ocount=0, savebyeach=False, savepath=None):
         '''